@@ -2,17 +2,30 @@ from calibration_profile import CalibrationData
 from scipy.signal import savgol_filter
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
-from tqdm import tqdm
 import numpy as np
 import cv2
+import logging
 import math
 
 DEGREE_OF_FUNCTION = 3
 
+logger = logging.getLogger(__name__)
 
-def prepare_for_engraving(image, calibration_data: CalibrationData):
-    model, polynomial_features = construct_model_from_calibration(calibration_data)
-    transformed_rgb = transform_image(image, model, polynomial_features)
+
+class EngravingModel:
+    """Regression model fitted once from a calibration, only read afterwards and therefore safe to share."""
+
+    def __init__(self, calibration_data: CalibrationData):
+        self.model, self.polynomial_features = construct_model_from_calibration(calibration_data)
+
+
+def prepare_for_engraving(image, calibration_data: CalibrationData = None, engraving_model: EngravingModel = None):
+    # fitting the model only depends on the calibration, pass a prepared one to avoid refitting it for each image
+    if engraving_model is None:
+        if calibration_data is None:
+            raise ValueError("Either calibration_data or engraving_model is required.")
+        engraving_model = EngravingModel(calibration_data)
+    transformed_rgb = transform_image(image, engraving_model.model, engraving_model.polynomial_features)
 
     return transformed_rgb
 
@@ -41,7 +54,8 @@ def transform_image(image, model, polynomial_features):
     # experimental and can be optimized
     # lightnesses = stretch_levels(lightnesses)
 
-    lightnesses_poly = polynomial_features.fit_transform(lightnesses)
+    # only transform, refitting would modify the (possibly shared) features object
+    lightnesses_poly = polynomial_features.transform(lightnesses)
 
     # use the model to predict the adapted lightnesses for the lasercutter
     out_lightness = model.predict(lightnesses_poly)
@@ -62,9 +76,8 @@ def stretch_levels(lightnesses):
     max_darkness_photo = np.min(lightnesses)
     max_lightness_photo = np.max(lightnesses)
 
-    print("Adapting lightnesses of input photo...")
-    lightnesses_stretched = np.array(
-        [relative_lightness(value, max_lightness_photo, max_darkness_photo) for value in tqdm(lightnesses)]).reshape(-1, 1)
+    logger.info("Adapting lightnesses of input photo...")
+    lightnesses_stretched = relative_lightness(lightnesses, max_lightness_photo, max_darkness_photo).reshape(-1, 1)
 
     return lightnesses_stretched
 
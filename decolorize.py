@@ -1,3 +1,4 @@
+import logging
 import numpy as np
 
 # source: https://github.com/damondpham/decolorize-RGB2grayscale
@@ -9,7 +10,15 @@ import numpy as np
 # http://www.eyemaginary.com/Portfolio/TurnColorsGray.html
 # http://www.eyemaginary.com/Rendering/decolorize.m
 
-def decolorize(img, scale=None, effect=.5, noise=.001):
+logger = logging.getLogger(__name__)
+
+
+def decolorize(img, scale=None, effect=.5, noise=.001, rng=None):
+    # adapted this to take an explicit random generator instead of the global NumPy state,
+    # so concurrent calls do not share (and race on) one generator
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Read image as matrix.
     # RGB = mpimg.imread(img_fname)
     # adapted this to allow passing an already loaded image
@@ -27,7 +36,7 @@ def decolorize(img, scale=None, effect=.5, noise=.001):
     # If the image is black and white, we only have 
     ## the luminence channel itself (Y/L).
     if len(dims) == 1: 
-        print('Image is already decolorized.')
+        logger.info('Image is already decolorized.')
         return RGB
     
     tol = 100*np.finfo(float).eps
@@ -62,7 +71,7 @@ def decolorize(img, scale=None, effect=.5, noise=.001):
     # Sample each pixel's neighborhood.
     mesh = np.meshgrid(range(dims[0]), range(dims[1]))
     mesh = np.dstack([mesh[0], mesh[1]]).reshape(-1, 2)
-    displace = scale * np.sqrt(2/np.pi) * np.random.normal(size=[dims[0]*dims[1],2])
+    displace = scale * np.sqrt(2/np.pi) * rng.normal(size=[dims[0]*dims[1],2])
     look = np.round(mesh + displace)
     # Correct out-of-bounds sample indices.
     redo = look[:,0] < 0
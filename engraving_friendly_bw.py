@@ -1,16 +1,26 @@
 from decolorize import decolorize
-import matplotlib.pyplot as plt
+from matplotlib import cm
 import numpy as np
 import cv2 as cv
+import logging
 
+logger = logging.getLogger(__name__)
 
-def convert_photo_to_engraving_friendly_bw(image, calibration_data):
-    decolorized = decolorize(image) # decolorize
+# grey bytes of matplotlib's gray colormap, read once at import because the colormap builds its table lazily on the
+# first call, which is not safe when several threads make that first call at the same time
+GREY_LEVELS = 256
+GREY_TABLE = cm.gray(np.arange(GREY_LEVELS) / GREY_LEVELS, bytes=True)[:, 0]
+GREY_TABLE.setflags(write=False)
+
+
+def convert_photo_to_engraving_friendly_bw(image, calibration_data, rng=None):
+    decolorized = decolorize(image, rng=rng) # decolorize
     grey_channel = decolorized[:,:,0]
 
     # normalize values
     normalized = (grey_channel - np.min(grey_channel)) / (np.max(grey_channel) - np.min(grey_channel))
-    grey_image = plt.cm.gray(normalized, bytes=True)[:, :, [0]].reshape(normalized.shape[:2])
+    grey_indices = np.minimum((np.nan_to_num(normalized) * GREY_LEVELS).astype(np.intp), GREY_LEVELS - 1)
+    grey_image = GREY_TABLE[grey_indices]
 
     # equalize histogram
     # img = cv.cvtColor(img, cv.COLOR_BGR2GRAY);
@@ -47,6 +57,6 @@ def get_clahe_clip_limit(calibration_data):
     else:
         clip_limit = 35.0 * dark_light_range
 
-    print("This calibration has a light/dark range of {}, will apply a CLAHE clip limit of {}".format(calibration_data.get_dark_light_range(), clip_limit))
+    logger.info("This calibration has a light/dark range of {}, will apply a CLAHE clip limit of {}".format(calibration_data.get_dark_light_range(), clip_limit))
 
     return clip_limit
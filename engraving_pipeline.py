@@ -0,0 +1,62 @@
+# Library entry point for optimizing photos for engraving.
+#
+# All functions in here are reentrant: they keep no module level state, do not use the global NumPy random state and
+# report progress via logging instead of printing. Everything derived from a scanned calibration gauge lives in an
+# EngravingProfile, which is built once and only read afterwards, so a single profile can be shared by many threads,
+# e.g. when optimizing several photos on a concurrent.futures.ThreadPoolExecutor.
+
+from calibration_profile import AbstractCalibrationImageSpecification, CalibrationData, Image
+from engraving_simulator import simulate_engraving, prepare_simulation_table
+from bw_to_engraving import prepare_for_engraving, EngravingModel
+from engraving_friendly_bw import convert_photo_to_engraving_friendly_bw
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EngravingProfile:
+    """Everything derived from one scanned calibration gauge, safe to share between threads."""
+
+    def __init__(self, calibration_data: CalibrationData):
+        self.calibration_data = calibration_data
+        self.engraving_model = EngravingModel(calibration_data)
+        self.simulation_table = prepare_simulation_table(calibration_data)
+
+    @staticmethod
+    def from_calibration_image(calibration_specification: AbstractCalibrationImageSpecification,
+                               calibration_image: Image):
+        return EngravingProfile(CalibrationData(calibration_specification, calibration_image))
+
+
+class OptimizationResult:
+
+    def __init__(self, engraving_friendly, for_engraving, simulated):
+        self.engraving_friendly = engraving_friendly
+        self.for_engraving = for_engraving
+        self.simulated = simulated
+
+
+def convert_to_engraving_friendly_bw(image: Image, profile: EngravingProfile, rng: np.random.Generator = None):
+    return convert_photo_to_engraving_friendly_bw(image, profile.calibration_data, rng=rng)
+
+
+def adapt_to_profile(image: Image, profile: EngravingProfile):
+    return prepare_for_engraving(image, engraving_model=profile.engraving_model)
+
+
+def simulate(image: Image, profile: EngravingProfile):
+    return simulate_engraving(image, simulation_table=profile.simulation_table)
+
+
+def optimize_color_photo(image: Image, profile: EngravingProfile, rng: np.random.Generator = None) -> OptimizationResult:
+    logger.info("Converting color photo to engraving friendly bw photo")
+    engraving_friendly = convert_to_engraving_friendly_bw(image, profile, rng=rng)
+
+    logger.info("Adapting photo to profile of laser")
+    for_engraving = adapt_to_profile(engraving_friendly, profile)
+
+    logger.info("Simulating engraving")
+    simulated = simulate(for_engraving, profile)
+
+    return OptimizationResult(engraving_friendly, for_engraving, simulated)
@@ -2,20 +2,20 @@ import cv2 as cv
 import numpy as np
 from bisect import bisect
 from calibration_profile import CalibrationData
-from tqdm import tqdm
 
-simulation_table_cache = {}
 
-def simulate_engraving(input_image, calibration_data: CalibrationData):
+def simulate_engraving(input_image, calibration_data: CalibrationData = None, simulation_table=None):
+    # the simulation table only depends on the calibration, pass a prepared one to avoid rebuilding it for each image
+    if simulation_table is None:
+        if calibration_data is None:
+            raise ValueError("Either calibration_data or simulation_table is required.")
+        simulation_table = prepare_simulation_table(calibration_data)
+
     hls_image = cv.cvtColor(input_image, cv.COLOR_RGB2HLS)
     lightnesses = hls_image.reshape(-1, 3)[:, [1]]
 
-    if calibration_data not in simulation_table_cache:
-        simulation_table_cache[calibration_data] = prepare_simulation_table(calibration_data)
-    simulation_table = simulation_table_cache[calibration_data]
-
-    print("Simulating lightnesses...")
-    transformed = np.array([[simulation_table[int(xi[0])]] for xi in tqdm(lightnesses)])
+    # look up all lightnesses at once, truncating like the table keys
+    transformed = simulation_table[np.clip(lightnesses, 0, 255).astype(np.intp)]
 
     # add zero columns and reshape to transform into a correct HSL image
     out_hls = np.c_[np.zeros(transformed.shape[0]), transformed, np.zeros(transformed.shape[0])]
@@ -44,7 +44,7 @@ def prepare_simulation_table(calibration_data):
             return ((output_dict[upper_neighbor] * (1 - (upper_neighbor - input_lightness) / range)) \
                     + (output_dict[lower_neighbor] * ((upper_neighbor - input_lightness) / range)))
 
-    simulation_table = {}
-    for l in range(256):
-        simulation_table[l] = int(interpolated_output_lightness(l))
+    simulation_table = np.array([int(interpolated_output_lightness(l)) for l in range(256)])
+    # shared between threads, so make sure nobody modifies it
+    simulation_table.setflags(write=False)
     return simulation_table
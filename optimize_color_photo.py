@@ -1,9 +1,8 @@
 import argparse
-from calibration_profile import GridCalibrationSpecification, CalibrationData
-from engraving_simulator import simulate_engraving
-from bw_to_engraving import prepare_for_engraving
-from engraving_friendly_bw import convert_photo_to_engraving_friendly_bw
+from calibration_profile import GridCalibrationSpecification
+from engraving_pipeline import EngravingProfile, convert_to_engraving_friendly_bw, adapt_to_profile, simulate
 import cv2 as cv
+import logging
 
 parser = argparse.ArgumentParser(description='Optimize a color photo for engraving.')
 parser.add_argument('block_size', type=int,
@@ -21,20 +20,22 @@ parser.add_argument('photo_path', type=str,
 
 args = parser.parse_args()
 
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 print("## Load laser profile")
 calibration_image = cv.imread(args.scanned_gauge_path)
 grid_spec = GridCalibrationSpecification(args.block_size, args.row_num, args.column_num)
-calibration_data = CalibrationData(grid_spec, calibration_image)
+profile = EngravingProfile.from_calibration_image(grid_spec, calibration_image)
 
 print("## Convert color photo to engraving friendly bw photo")
 input_image = cv.imread(args.photo_path, cv.IMREAD_COLOR)
-engraving_friendly = convert_photo_to_engraving_friendly_bw(input_image, calibration_data)
+engraving_friendly = convert_to_engraving_friendly_bw(input_image, profile)
 cv.imwrite('greyscale.png', engraving_friendly)
 
 print("## Adapt photo to profile of laser")
-for_engraving = prepare_for_engraving(engraving_friendly, calibration_data)
+for_engraving = adapt_to_profile(engraving_friendly, profile)
 cv.imwrite('greyscale_for_engraving.png', for_engraving)
 
 print("## Simulate engraving")
-simulated = simulate_engraving(for_engraving, calibration_data)
+simulated = simulate(for_engraving, profile)
 cv.imwrite('engraving_simulation_result.png', simulated)
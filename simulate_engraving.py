@@ -1,7 +1,8 @@
 import argparse
 from calibration_profile import GridCalibrationSpecification, CalibrationData
-from engraving_simulator import simulate_engraving
+from engraving_simulator import simulate_engraving, prepare_simulation_table
 import cv2 as cv
+import logging
 
 parser = argparse.ArgumentParser(description='Simulate engraving of photo.')
 parser.add_argument('block_size', type=int,
@@ -18,13 +19,17 @@ parser.add_argument('photo_path', type=str,
 
 args = parser.parse_args()
 
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 print("## Load laser profile")
 calibration_image = cv.imread(args.scanned_gauge_path)
 grid_spec = GridCalibrationSpecification(args.block_size, args.row_num, args.column_num)
 calibration_data = CalibrationData(grid_spec, calibration_image)
+# only simulating, so the regression model used for optimizing photos is not needed
+simulation_table = prepare_simulation_table(calibration_data)
 
 for_engraving = cv.imread(args.photo_path, cv.IMREAD_COLOR)
 
 print("## Simulate engraving")
-simulated = simulate_engraving(for_engraving, calibration_data)
+simulated = simulate_engraving(for_engraving, simulation_table=simulation_table)
 cv.imwrite('simulated.png', simulated)